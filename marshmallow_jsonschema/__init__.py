@@ -1,6 +1,9 @@
-from importlib.metadata import version
+try:
+    from ._version import __version__
+except ImportError:  # pragma: no cover
+    from importlib.metadata import version
 
-__version__ = version("marshmallow-jsonschema")
+    __version__ = version("marshmallow-jsonschema")
 __license__ = "MIT"
 
 from .base import JSONSchema
@@ -30,23 +30,31 @@ from .validation import (
     handle_regexp,
 )
 
+_MARSHMALLOW_SUPPORTS_NATIVE_ENUMS = Version(_marshmallow_version) >= Version("3.18")
+
 
 def marshmallow_version_supports_native_enums() -> bool:
     """
     returns true if and only if the version of marshmallow installed supports enums natively
     """
-    return Version(_marshmallow_version) >= Version("3.18")
+    return _MARSHMALLOW_SUPPORTS_NATIVE_ENUMS
+
 
+def _detect_marshmallow_enum_support() -> tuple[type | None, type | None]:
+    """
+    returns marshmallow_enum's EnumField and LoadDumpOptions, or a pair of None if they can't be imported
+    """
+    try:
+        from marshmallow_enum import EnumField, LoadDumpOptions  # noqa: PLC0415 - optional dependency
+    except ImportError:
+        return None, None
+    return EnumField, LoadDumpOptions
 
-try:
-    from marshmallow_enum import EnumField as MarshmallowEnumEnumField
-    from marshmallow_enum import LoadDumpOptions
 
-    ALLOW_MARSHMALLOW_ENUM_ENUMS = True
-except ImportError:
-    ALLOW_MARSHMALLOW_ENUM_ENUMS = False
+MarshmallowEnumEnumField, LoadDumpOptions = _detect_marshmallow_enum_support()
+ALLOW_MARSHMALLOW_ENUM_ENUMS = MarshmallowEnumEnumField is not None
 
-ALLOW_MARSHMALLOW_NATIVE_ENUMS = marshmallow_version_supports_native_enums()
+ALLOW_MARSHMALLOW_NATIVE_ENUMS = _MARSHMALLOW_SUPPORTS_NATIVE_ENUMS
 if ALLOW_MARSHMALLOW_NATIVE_ENUMS:
     from marshmallow.fields import Enum as MarshmallowNativeEnumField
 
@@ -79,7 +87,8 @@ PY_TO_JSON_TYPES_MAP = {
 # and then `fields.Number` might end up before `fields.Integer`.
 # As we perform sequential subclass check to determine proper Python type,
 # we can't let that happen.
-MARSHMALLOW_TO_PY_TYPES_PAIRS = [
+# A tuple, so that the python types cached per field class in `_PYTYPE_CACHE` can't go out of date.
+MARSHMALLOW_TO_PY_TYPES_PAIRS: tuple[tuple[type, type], ...] = (
     # This part of a mapping is carefully selected from marshmallow source code,
     # see marshmallow.BaseSchema.TYPE_MAPPING.
     (fields.UUID, uuid.UUID),
@@ -106,14 +115,14 @@ MARSHMALLOW_TO_PY_TYPES_PAIRS = [
     # This one is here just for completeness sake and to check for
     # unknown marshmallow fields more cleanly.
     (fields.Nested, dict),
-]
+)
 
 if ALLOW_MARSHMALLOW_NATIVE_ENUMS:
-    MARSHMALLOW_TO_PY_TYPES_PAIRS.append((MarshmallowNativeEnumField, Enum))
+    MARSHMALLOW_TO_PY_TYPES_PAIRS += ((MarshmallowNativeEnumField, Enum),)
 if ALLOW_MARSHMALLOW_ENUM_ENUMS:
     # We currently only support loading enum's from their names. So the possible
     # values will always map to string in the JSONSchema
-    MARSHMALLOW_TO_PY_TYPES_PAIRS.append((MarshmallowEnumEnumField, Enum))
+    MARSHMALLOW_TO_PY_TYPES_PAIRS += ((MarshmallowEnumEnumField, Enum),)
 
 
 FIELD_VALIDATORS = {
@@ -128,6 +137,46 @@ FIELD_VALIDATORS = {
 # Metadata item to specify what python type to interpret custom field classes as
 PYTYPE_KEY = "jsonschema_python_type"
 
+# Field attribute or metadata item supplying the schema of custom field classes, kept for backwards compatibility
+_TYPE_MAPPING_KEY = "_jsonschema_type_mapping"
+
+# Sentinel for lookups where None is a meaningful value
+_NOT_FOUND = object()
+
+# Metadata items which are not copied into the generated schema of a field
+_RESERVED_METADATA_KEYS = frozenset(("metadata", "name", PYTYPE_KEY))
+_RESERVED_NESTED_METADATA_KEYS = frozenset(("metadata", "name"))
+
+# Kinds of field which are converted differently, see `_classify_field`
+_FIELD_KIND_PLAIN = 0
+_FIELD_KIND_NESTED = 1
+_FIELD_KIND_UNION = 2
+_FIELD_KIND_CACHE: dict[type, tuple[int, bool]] = {}
+
+# Enum field classes whose values are listed in the generated schema, see `_is_enum_field`
+_ENUM_FIELD_CLASSES: tuple[type, ...] = ()
+if ALLOW_MARSHMALLOW_NATIVE_ENUMS:
+    _ENUM_FIELD_CLASSES += (MarshmallowNativeEnumField,)
+if ALLOW_MARSHMALLOW_ENUM_ENUMS:
+    _ENUM_FIELD_CLASSES += (MarshmallowEnumEnumField,)
+_IS_ENUM_FIELD_CACHE: dict[type, bool] = {}
+
+
+def _match_python_type(field_class: type) -> type | None:
+    """Get the python type of the first `MARSHMALLOW_TO_PY_TYPES_PAIRS` entry that field_class is a subclass of"""
+    for map_class, pytype in MARSHMALLOW_TO_PY_TYPES_PAIRS:
+        if issubclass(field_class, map_class):
+            return pytype
+    return None
+
+
+# Resolved python type per field class, so that the subclass checks against `MARSHMALLOW_TO_PY_TYPES_PAIRS` only
+# run once per field class. Seeded with the classes listed there, other subclasses are added by
+# `JSONSchema._get_python_type` when first seen.
+_PYTYPE_CACHE: dict[type, type] = {
+    map_class: _match_python_type(map_class) for map_class, _ in MARSHMALLOW_TO_PY_TYPES_PAIRS
+}
+
 
 def _resolve_additional_properties(cls) -> bool:
     meta = cls.Meta
@@ -151,6 +200,50 @@ def _resolve_additional_properties(cls) -> bool:
     raise UnsupportedValueError(msg)
 
 
+def _classify_field(field: fields.Field) -> tuple[int, bool]:
+    """Get the kind of field and whether its class defines `_jsonschema_type_mapping`, classified once per field
+    class and remembered in `_FIELD_KIND_CACHE`.
+
+    Union fields only set their sub-fields on the instance, so the first instance seen decides for its class.
+    """
+    field_class = type(field)
+    classification = _FIELD_KIND_CACHE.get(field_class)
+    if classification is None:
+        if isinstance(field, fields.Nested):
+            field_kind = _FIELD_KIND_NESTED
+        elif hasattr(field, "union_fields") or hasattr(field, "_candidate_fields"):
+            field_kind = _FIELD_KIND_UNION
+        else:
+            field_kind = _FIELD_KIND_PLAIN
+        classification = (field_kind, hasattr(field_class, _TYPE_MAPPING_KEY))
+        _FIELD_KIND_CACHE[field_class] = classification
+    return classification
+
+
+def _is_enum_field(field_class: type) -> bool:
+    """Whether field_class is an enum field, checked once per field class and remembered in `_IS_ENUM_FIELD_CACHE`"""
+    is_enum_field = _IS_ENUM_FIELD_CACHE.get(field_class)
+    if is_enum_field is None:
+        is_enum_field = _IS_ENUM_FIELD_CACHE[field_class] = issubclass(field_class, _ENUM_FIELD_CLASSES)
+    return is_enum_field
+
+
+def _copy_field_metadata(schema: dict[str, Any], field: fields.Field, reserved_keys: frozenset[str]) -> None:
+    """Copy the metadata of field into its schema, leaving out reserved_keys.
+
+    NOTE: the "metadata" item is doubled up to maintain backwards compatibility, values set directly in metadata take
+    precedence.
+    """
+    # Most fields have no metadata at all
+    if not field.metadata:
+        return
+    for metadata in (field.metadata.get("metadata") or {}, field.metadata):
+        if reserved_keys.isdisjoint(metadata):
+            schema.update(metadata)
+        else:
+            schema.update((md_key, md_val) for md_key, md_val in metadata.items() if md_key not in reserved_keys)
+
+
 class JSONSchema(Schema):
     """Converts to JSONSchema as defined by http://json-schema.org/."""
 
@@ -167,43 +260,63 @@ class JSONSchema(Schema):
                                    ordering of fields too (via `class Meta`, attribute `ordered`).
         """
         self._nested_schema_classes: dict[str, dict[str, Any]] = {}
+        self._ref_cache: dict[str, dict[str, str]] = {}
+        self._clear_required()
         self.nested = kwargs.pop("nested", False)
         self.props_ordered = kwargs.pop("props_ordered", False)
         self.opts.ordered = self.props_ordered
         super().__init__(*args, **kwargs)
 
     def get_properties(self, obj) -> dict[str, dict[str, Any]]:
-        """Fill out properties field."""
+        """Fill out properties field, collecting the required fields in the same pass for `get_required`."""
         properties = self.dict_class()
+        required = []
+        get_schema_for_field = self._get_schema_for_field
 
-        if self.props_ordered:
-            fields_items_sequence = obj.fields.items()
-        elif callable(obj):
-            fields_items_sequence = sorted(obj().fields.items())
-        else:
-            fields_items_sequence = sorted(obj.fields.items())
+        obj_fields = self._get_obj_fields(obj)
+        fields_items_sequence = obj_fields.items() if self.props_ordered else sorted(obj_fields.items())
 
-        for _field_name, field in fields_items_sequence:
-            schema = self._get_schema_for_field(obj, field)
-            properties[field.metadata.get("name") or field.data_key or field.name] = schema
+        for field_name, field in fields_items_sequence:
+            name = field.metadata.get("name") or field.data_key or field.name
+            properties[name] = get_schema_for_field(obj, field)
+            if field.required:
+                required.append((field_name, field.data_key or field.name))
+
+        if self.props_ordered:
+            # required is always sorted by field name, regardless of the order of the properties
+            required.sort()
+        self._required_obj = obj
+        self._required = [required_name for _field_name, required_name in required]
 
         return properties
 
     def get_required(self, obj) -> list[str] | _Missing:
         """Fill out required field."""
-        required = []
-        field_items_iterable = sorted(obj().fields.items()) if callable(obj) else sorted(obj.fields.items())
-        for _field_name, field in field_items_iterable:
-            if field.required:
-                required.append(field.data_key or field.name)
+        if self._required_obj is obj:
+            required = self._required
+        else:
+            required = [
+                field.data_key or field.name
+                for _field_name, field in sorted(self._get_obj_fields(obj).items())
+                if field.required
+            ]
 
         return required or missing
 
+    @staticmethod
+    def _get_obj_fields(obj) -> dict[str, fields.Field]:
+        return (obj() if callable(obj) else obj).fields
+
+    def _clear_required(self) -> None:
+        self._required_obj = None
+        self._required: list[str] = []
+
     def _from_python_type(self, obj, field, pytype: builtins.type) -> dict[str, Any]:
         """Get schema definition from python type."""
         json_schema = {"title": field.attribute or field.name or ""}
 
-        json_schema.update(dict(PY_TO_JSON_TYPES_MAP[pytype]))
+        # The PY_TO_JSON_TYPES_MAP templates are only ever read, never mutated, so they can be merged in directly
+        json_schema.update(PY_TO_JSON_TYPES_MAP[pytype])
 
         if field.dump_only:
             json_schema["readOnly"] = True
@@ -211,23 +324,18 @@ class JSONSchema(Schema):
         if field.default is not missing and not callable(field.default):
             json_schema["default"] = field.default
 
-        if ALLOW_MARSHMALLOW_NATIVE_ENUMS and isinstance(field, MarshmallowNativeEnumField):
-            json_schema["enum"] = self._get_marshmallow_native_enum_values(field)
-        elif ALLOW_MARSHMALLOW_ENUM_ENUMS and isinstance(field, MarshmallowEnumEnumField):
-            json_schema["enum"] = self._get_marshmallow_enum_enum_values(field)
+        # gated on the field class rather than the python type, which `jsonschema_python_type` may override
+        if _is_enum_field(type(field)):
+            if ALLOW_MARSHMALLOW_NATIVE_ENUMS and isinstance(field, MarshmallowNativeEnumField):
+                json_schema["enum"] = self._get_marshmallow_native_enum_values(field)
+            elif ALLOW_MARSHMALLOW_ENUM_ENUMS and isinstance(field, MarshmallowEnumEnumField):
+                json_schema["enum"] = self._get_marshmallow_enum_enum_values(field)
 
         if field.allow_none:
-            previous_type = json_schema["type"]
-            json_schema["type"] = [previous_type, "null"]
+            # a new list on purpose, sharing one between schemas would let changes to one dumped schema leak into others
+            json_schema["type"] = [json_schema["type"], "null"]
 
-        # NOTE: doubled up to maintain backwards compatibility
-        metadata = field.metadata.get("metadata", {})
-        metadata.update(field.metadata)
-
-        for md_key, md_val in metadata.items():
-            if md_key in ("metadata", "name", PYTYPE_KEY):
-                continue
-            json_schema[md_key] = md_val
+        _copy_field_metadata(json_schema, field, _RESERVED_METADATA_KEYS)
 
         if pytype in (list, set, tuple):
             if isinstance(field, fields.List) or hasattr(field, "inner"):
@@ -312,7 +420,7 @@ class JSONSchema(Schema):
     @staticmethod
     def _get_python_type(field: fields.Field) -> builtins.type:
         """Get python type based on field subclass"""
-        class_lookup = field.__class__
+        class_lookup = type(field)
         if PYTYPE_KEY in field.metadata:
             pytype = field.metadata[PYTYPE_KEY]
             if not isinstance(pytype, type):
@@ -322,9 +430,13 @@ class JSONSchema(Schema):
                 msg = f"'{pytype.__name__}' is not a supported python type for '{PYTYPE_KEY}'"
             else:
                 return pytype
-        for map_class, pytype in MARSHMALLOW_TO_PY_TYPES_PAIRS:
-            if issubclass(class_lookup, map_class):
-                return pytype
+        pytype = _PYTYPE_CACHE.get(class_lookup)
+        if pytype is None:
+            pytype = _match_python_type(class_lookup)
+            if pytype is not None:
+                _PYTYPE_CACHE[class_lookup] = pytype
+        if pytype is not None:
+            return pytype
         if PYTYPE_KEY not in field.metadata:
             msg = f"Unsupported field type {field.__class__.__name__}"
 
@@ -334,25 +446,24 @@ class JSONSchema(Schema):
     @staticmethod
     def _get_value_from_obj_or_metadata(field: fields.Field, attr: str) -> Any:
         """
-        Helper function to search for and return an attribute. First checks for a direct attribute, then checks in
-        metadata. If the attribute value is a function, run and return the function output.
+        Helper function to search for and return an attribute. Checks in metadata first, falling back to a direct
+        attribute. If the attribute value is a function, run and return the function output.
         Returns None if the attribute is not found in either location.
         """
-
-        def value():
-            return None
-
-        if hasattr(field, attr):
-            value = getattr(field, attr)
-        if attr in field.metadata:
-            value = field.metadata[attr]
+        value = field.metadata.get(attr, _NOT_FOUND)
+        if value is _NOT_FOUND:
+            value = getattr(field, attr, None)
         return value() if callable(value) else value
 
     def _get_schema_for_field(self, obj, field):
         """Get schema and validators for field."""
         # For backwards compatibility, can still use '_jsonschema_type_mapping' with JSON equivalent Field type.
         # Will just use the 'jsonschema_python_type' metadata mapping if present
-        supplied_field_schema = self._get_value_from_obj_or_metadata(field, "_jsonschema_type_mapping")
+        field_kind, class_has_type_mapping = _classify_field(field)
+        supplied_field_schema = None
+        # The mapping is usually a method of the field class, most fields can skip looking for it
+        if class_has_type_mapping or _TYPE_MAPPING_KEY in field.metadata or _TYPE_MAPPING_KEY in vars(field):
+            supplied_field_schema = self._get_value_from_obj_or_metadata(field, _TYPE_MAPPING_KEY)
         if supplied_field_schema is not None and PYTYPE_KEY not in field.metadata:
             if not isinstance(supplied_field_schema, dict):
                 msg = (
@@ -363,22 +474,21 @@ class JSONSchema(Schema):
             pytype = supplied_field_schema.pop("generate_missing_schema_keys", False)
             schema = self._from_python_type(obj, field, pytype) if pytype and isinstance(pytype, builtins.type) else {}
             schema.update(supplied_field_schema)
-        elif isinstance(field, fields.Nested):
+        elif field_kind == _FIELD_KIND_NESTED:
             # Special treatment for nested fields.
             schema = self._from_nested_schema(obj, field)
-        elif hasattr(field, "union_fields") or hasattr(field, "_candidate_fields"):
+        elif field_kind == _FIELD_KIND_UNION:
             schema = self._from_union_schema(obj, field)
         else:
             pytype = self._get_python_type(field)
             schema = self._from_python_type(obj, field, pytype)
         # Apply any and all validators that field may have
         for validator in field.validators:
-            if validator.__class__ in FIELD_VALIDATORS:
-                schema = FIELD_VALIDATORS[validator.__class__](schema, field, validator, obj)
-            else:
-                base_class = getattr(validator, "_jsonschema_base_validator_class", None)
-                if base_class is not None and base_class in FIELD_VALIDATORS:
-                    schema = FIELD_VALIDATORS[base_class](schema, field, validator, obj)
+            handler = FIELD_VALIDATORS.get(type(validator))
+            if handler is None:
+                handler = FIELD_VALIDATORS.get(getattr(validator, "_jsonschema_base_validator_class", None))
+            if handler is not None:
+                schema = handler(schema, field, validator, obj)
         return schema
 
     def _from_nested_schema(self, obj, field):
@@ -417,14 +527,7 @@ class JSONSchema(Schema):
         # and the schema is just a reference to the def
         schema = self._schema_base(name)
 
-        # NOTE: doubled up to maintain backwards compatibility
-        metadata = field.metadata.get("metadata", {})
-        metadata.update(field.metadata)
-
-        for md_key, md_val in metadata.items():
-            if md_key in ("metadata", "name"):
-                continue
-            schema[md_key] = md_val
+        _copy_field_metadata(schema, field, _RESERVED_NESTED_METADATA_KEYS)
 
         if field.default is not missing and not callable(field.default):
             schema["default"] = nested_instance.dump(field.default)
@@ -438,16 +541,29 @@ class JSONSchema(Schema):
         return schema
 
     def _schema_base(self, name):
-        return {"type": "object", "$ref": f"#/definitions/{name}"}
+        ref = self._ref_cache.get(name)
+        if ref is None:
+            ref = self._ref_cache[name] = {"type": "object", "$ref": "#/definitions/" + name}
+        # Copied so that metadata merged in by the caller doesn't leak into later references
+        return ref.copy()
 
     def dump(self, obj, **kwargs):
-        """Take obj for later use: using class name to namespace definition."""
+        """Take obj for later use: using class name to namespace definition.
+
+        A schema class is instantiated once here, so that every field dumped from it shares the same instance.
+        Definitions are collected afresh for each dump, so an instance can be reused for several schemas.
+        """
+        if isclass(obj) and issubclass(obj, Schema):
+            obj = obj()
         self.obj = obj
+        self._nested_schema_classes = {}
+        self._clear_required()
         return super().dump(obj, **kwargs)
 
     @post_dump
     def wrap(self, data, **_) -> dict[str, Any]:
         """Wrap this with the root schema definitions."""
+        self._clear_required()
         if self.nested:  # no need to wrap, will be in outer defs
             return data
 
@@ -51,6 +51,5 @@ class ReactJsonSchemaFormJSONSchema(JSONSchema):
 
         for field_name, field in obj.fields.items():
             # NOTE: doubled up to maintain backwards compatibility
-            metadata = field.metadata.get("metadata", {})
-            metadata.update(field.metadata)
+            metadata = {**field.metadata.get("metadata", {}), **field.metadata}
             yield field_name, {k: v for k, v in metadata.items() if k.startswith("ui:")}
@@ -1,4 +1,5 @@
 from jsonschema import Draft7Validator
+from jsonschema.exceptions import SchemaError
 from marshmallow import Schema, fields, validate
 
 from marshmallow_jsonschema import JSONSchema
@@ -50,15 +51,21 @@ class UserSchema(Schema):
     is_user = fields.Boolean(validate=validate.Equal(comparable=True))
 
 
+# Built once rather than on every check, mirroring what `Draft7Validator.check_schema` constructs
+_META_SCHEMA_VALIDATOR = Draft7Validator(Draft7Validator.META_SCHEMA, format_checker=Draft7Validator.FORMAT_CHECKER)
+
+
 def _validate_schema(schema):
     """
     raises jsonschema.exceptions.SchemaError
     """
-    Draft7Validator.check_schema(schema)
+    for error in _META_SCHEMA_VALIDATOR.iter_errors(schema):
+        raise SchemaError.create_from(error)
 
 
-def validate_and_dump(schema):
-    json_schema = JSONSchema()
+def validate_and_dump(schema, json_schema=None):
+    if json_schema is None:
+        json_schema = JSONSchema()
     data = json_schema.dump(schema)
     _validate_schema(data)
     # ensure last version
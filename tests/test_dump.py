@@ -1,6 +1,8 @@
+import copy
 import uuid
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
 import pytest
 from marshmallow import Schema, fields, validate
@@ -11,59 +13,81 @@ from marshmallow_union import Union
 import marshmallow_jsonschema
 from marshmallow_jsonschema import JSONSchema, UnsupportedValueError
 
-from . import UserSchema, validate_and_dump
+from . import UserSchema, _validate_schema, validate_and_dump
 
 TEST_MARSHMALLOW_NATIVE_ENUM = marshmallow_jsonschema.base.marshmallow_version_supports_native_enums()
-try:
-    from marshmallow.fields import Enum as MarshmallowNativeEnumField
-except ImportError:
-    assert TEST_MARSHMALLOW_NATIVE_ENUM is False
+MarshmallowNativeEnumField = getattr(fields, "Enum", None)
 
 
-def test_dump_schema():
-    schema = UserSchema()
+@pytest.fixture(scope="module")
+def json_schema():
+    return JSONSchema()
 
-    dumped = validate_and_dump(schema)
 
-    assert len(schema.fields) > 1
+@dataclass
+class BasicDataClass:
+    field_1: int
+    field_2: str
+    field_3: list[str]
 
-    props = dumped["definitions"]["UserSchema"]["properties"]
-    for field_name in schema.fields:
-        assert field_name in props
 
+@dataclass
+class UnionDataClass:
+    field_1: int | str | None
 
-def test_default():
-    schema = UserSchema()
 
-    dumped = validate_and_dump(schema)
+@dataclass
+class SubDataClass:
+    foo: int
+    bar: list[int | str]
 
-    props = dumped["definitions"]["UserSchema"]["properties"]
-    assert props["id"]["default"] == "no-id"
 
+@dataclass
+class NestedDataClass:
+    subclass: SubDataClass
+    other: str
 
-def test_default_callable_not_serialized():
-    class TestSchema(Schema):
-        uid = fields.UUID(default=uuid.uuid4)
 
-    schema = TestSchema()
+@pytest.fixture(scope="module")
+def user_schema():
+    return UserSchema()
 
-    dumped = validate_and_dump(schema)
 
-    props = dumped["definitions"]["TestSchema"]["properties"]
-    assert "default" not in props["uid"]
+@pytest.fixture(scope="module")
+def user_schema_props(user_schema, json_schema):
+    return validate_and_dump(user_schema, json_schema)["definitions"]["UserSchema"]["properties"]
 
 
-def test_uuid():
-    schema = UserSchema()
+def test_dump_schema(user_schema, user_schema_props):
+    assert len(user_schema.fields) > 1
 
-    dumped = validate_and_dump(schema)
+    for field_name in user_schema.fields:
+        assert field_name in user_schema_props
 
-    props = dumped["definitions"]["UserSchema"]["properties"]
-    assert props["uid"]["type"] == "string"
-    assert props["uid"]["format"] == "uuid"
+
+def test_default(user_schema_props):
+    assert user_schema_props["id"]["default"] == "no-id"
 
 
-def test_metadata():
+class CallableDefaultSchema(Schema):
+    uid = fields.UUID(default=uuid.uuid4)
+
+
+def test_default_callable_not_serialized(json_schema):
+    schema = CallableDefaultSchema()
+
+    dumped = validate_and_dump(schema, json_schema)
+
+    props = dumped["definitions"]["CallableDefaultSchema"]["properties"]
+    assert "default" not in props["uid"]
+
+
+def test_uuid(user_schema_props):
+    assert user_schema_props["uid"]["type"] == "string"
+    assert user_schema_props["uid"]["format"] == "uuid"
+
+
+def test_metadata(json_schema):
     """Metadata should be available in the field definition."""
 
     class TestSchema(Schema):
@@ -72,7 +96,7 @@ def test_metadata():
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     props = dumped["definitions"]["TestSchema"]["properties"]
     assert props["myfield"]["foo"] == "Bar"
@@ -81,67 +105,71 @@ def test_metadata():
     assert "metadata" not in props["yourfield"]
 
     # repeat process to assert idempotency
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     props = dumped["definitions"]["TestSchema"]["properties"]
     assert props["myfield"]["foo"] == "Bar"
     assert props["yourfield"]["baz"] == "waz"
 
 
-def test_descriptions():
+def test_descriptions(json_schema):
     class TestSchema(Schema):
         myfield = fields.String(metadata={"description": "Brown Cow"})
         yourfield = fields.Integer(required=True)
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     props = dumped["definitions"]["TestSchema"]["properties"]
     assert props["myfield"]["description"] == "Brown Cow"
 
 
-def test_nested_descriptions():
-    class TestNestedSchema(Schema):
-        myfield = fields.String(metadata={"description": "Brown Cow"})
-        yourfield = fields.Integer(required=True)
+class DescribedNestedSchema(Schema):
+    myfield = fields.String(metadata={"description": "Brown Cow"})
+    yourfield = fields.Integer(required=True)
 
-    class TestSchema(Schema):
-        nested = fields.Nested(TestNestedSchema, metadata={"description": "Nested 1", "title": "Title1"})
-        yourfield_nested = fields.Integer(required=True)
 
-    schema = TestSchema()
+class DescribedOuterSchema(Schema):
+    nested = fields.Nested(DescribedNestedSchema, metadata={"description": "Nested 1", "title": "Title1"})
+    yourfield_nested = fields.Integer(required=True)
 
-    dumped = validate_and_dump(schema)
 
-    nested_def = dumped["definitions"]["TestNestedSchema"]
-    nested_dmp = dumped["definitions"]["TestSchema"]["properties"]["nested"]
+def test_nested_descriptions(json_schema):
+    schema = DescribedOuterSchema()
+
+    dumped = validate_and_dump(schema, json_schema)
+
+    nested_def = dumped["definitions"]["DescribedNestedSchema"]
+    nested_dmp = dumped["definitions"]["DescribedOuterSchema"]["properties"]["nested"]
     assert nested_def["properties"]["myfield"]["description"] == "Brown Cow"
 
-    assert nested_dmp["$ref"] == "#/definitions/TestNestedSchema"
+    assert nested_dmp["$ref"] == "#/definitions/DescribedNestedSchema"
     assert nested_dmp["description"] == "Nested 1"
     assert nested_dmp["title"] == "Title1"
 
 
-def test_nested_string_to_cls():
-    class TestNamedNestedSchema(Schema):
-        foo = fields.Integer(required=True)
+class NamedNestedSchema(Schema):
+    foo = fields.Integer(required=True)
 
-    class TestSchema(Schema):
-        foo2 = fields.Integer(required=True)
-        nested = fields.Nested("TestNamedNestedSchema")
 
-    schema = TestSchema()
+class NamedOuterSchema(Schema):
+    foo2 = fields.Integer(required=True)
+    nested = fields.Nested("NamedNestedSchema")
+
+
+def test_nested_string_to_cls(json_schema):
+    schema = NamedOuterSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
-    nested_def = dumped["definitions"]["TestNamedNestedSchema"]
-    nested_dmp = dumped["definitions"]["TestSchema"]["properties"]["nested"]
+    nested_def = dumped["definitions"]["NamedNestedSchema"]
+    nested_dmp = dumped["definitions"]["NamedOuterSchema"]["properties"]["nested"]
     assert nested_dmp["type"] == "object"
     assert nested_def["properties"]["foo"]["type"] == "integer"
 
 
-def test_nested_context():
+def test_nested_context(json_schema):
     class TestNestedSchema(Schema):
         def __init__(self, *args, **kwargs):
             if kwargs.get("context", {}).get("hide", False):
@@ -155,10 +183,10 @@ def test_nested_context():
         bar = fields.Nested(TestNestedSchema)
 
     schema = TestSchema()
-    dumped_show = validate_and_dump(schema)
+    dumped_show = validate_and_dump(schema, json_schema)
 
     schema = TestSchema(context={"hide": True})
-    dumped_hide = validate_and_dump(schema)
+    dumped_hide = validate_and_dump(schema, json_schema)
 
     nested_show = dumped_show["definitions"]["TestNestedSchema"]["properties"]
     nested_hide = dumped_hide["definitions"]["TestNestedSchema"]["properties"]
@@ -169,14 +197,15 @@ def test_nested_context():
     assert "foo" not in nested_hide
 
 
-def test_list():
-    class ListSchema(Schema):
-        foo = fields.List(fields.String(), required=True)
+class StringListSchema(Schema):
+    foo = fields.List(fields.String(), required=True)
 
-    schema = ListSchema()
-    dumped = validate_and_dump(schema)
 
-    nested_json = dumped["definitions"]["ListSchema"]["properties"]["foo"]
+def test_list(json_schema):
+    schema = StringListSchema()
+    dumped = validate_and_dump(schema, json_schema)
+
+    nested_json = dumped["definitions"]["StringListSchema"]["properties"]["foo"]
     assert nested_json["type"] == "array"
     assert "items" in nested_json
 
@@ -184,179 +213,132 @@ def test_list():
     assert item_schema["type"] == "string"
 
 
-def test_list_nested():
-    """Test that a list field will work with an inner nested field."""
+class ListItemSchema(Schema):
+    foo = fields.Integer(required=True)
 
-    class InnerSchema(Schema):
-        foo = fields.Integer(required=True)
 
-    class ListSchema(Schema):
-        bar = fields.List(fields.Nested(InnerSchema), required=True)
+class NestedListSchema(Schema):
+    bar = fields.List(fields.Nested(ListItemSchema), required=True)
+
 
-    schema = ListSchema()
-    dumped = validate_and_dump(schema)
+def test_list_nested(json_schema):
+    """Test that a list field will work with an inner nested field."""
+    schema = NestedListSchema()
+    dumped = validate_and_dump(schema, json_schema)
 
-    nested_json = dumped["definitions"]["ListSchema"]["properties"]["bar"]
+    nested_json = dumped["definitions"]["NestedListSchema"]["properties"]["bar"]
 
     assert nested_json["type"] == "array"
     assert "items" in nested_json
 
     item_schema = nested_json["items"]
-    assert "InnerSchema" in item_schema["$ref"]
+    assert "ListItemSchema" in item_schema["$ref"]
 
 
-def test_dict():
-    class DictSchema(Schema):
-        foo = fields.Dict()
+class DictValueSchema(Schema):
+    foo = fields.Integer(required=True)
 
-    schema = DictSchema()
-    dumped = validate_and_dump(schema)
-
-    nested_json = dumped["definitions"]["DictSchema"]["properties"]["foo"]
 
-    assert nested_json["type"] == "object"
-    assert "additionalProperties" in nested_json
-
-    item_schema = nested_json["additionalProperties"]
-    assert item_schema == {}
-
-
-def test_dict_with_value_field():
-    class DictSchema(Schema):
-        foo = fields.Dict(keys=fields.String, values=fields.Integer)
-
-    schema = DictSchema()
-    dumped = validate_and_dump(schema)
+@pytest.mark.parametrize(
+    ("dict_field", "expected_values"),
+    [
+        pytest.param(fields.Dict(), {}, id="no value field"),
+        pytest.param(
+            fields.Dict(keys=fields.String, values=fields.Integer),
+            {"title": "foo", "type": "integer"},
+            id="value field",
+        ),
+        pytest.param(
+            fields.Dict(keys=fields.String, values=fields.Nested(DictValueSchema)),
+            {"type": "object", "$ref": "#/definitions/DictValueSchema"},
+            id="nested value field",
+        ),
+    ],
+)
+def test_dict(dict_field, expected_values, json_schema):
+    schema = Schema.from_dict({"foo": dict_field}, name="DictSchema")()
+    dumped = validate_and_dump(schema, json_schema)
 
     nested_json = dumped["definitions"]["DictSchema"]["properties"]["foo"]
 
     assert nested_json["type"] == "object"
-    assert "additionalProperties" in nested_json
+    assert nested_json["additionalProperties"] == expected_values
 
-    item_schema = nested_json["additionalProperties"]
-    assert item_schema["type"] == "integer"
 
+class DeepInnerSchema(Schema):
+    boz = fields.Integer(required=True)
 
-def test_dict_with_nested_value_field():
-    class InnerSchema(Schema):
-        foo = fields.Integer(required=True)
-
-    class DictSchema(Schema):
-        bar = fields.Dict(keys=fields.String, values=fields.Nested(InnerSchema))
 
-    schema = DictSchema()
-    dumped = validate_and_dump(schema)
+class DeepInnerMiddleSchema(Schema):
+    baz = fields.Nested(DeepInnerSchema, required=True)
 
-    nested_json = dumped["definitions"]["DictSchema"]["properties"]["bar"]
 
-    assert nested_json["type"] == "object"
-    assert "additionalProperties" in nested_json
+class DeepOuterMiddleSchema(Schema):
+    bar = fields.Nested(DeepInnerMiddleSchema, required=True)
 
-    item_schema = nested_json["additionalProperties"]
-    assert item_schema["type"] == "object"
 
-    assert "InnerSchema" in item_schema["$ref"]
+class DeepOuterSchema(Schema):
+    foo = fields.Nested(DeepOuterMiddleSchema, required=True)
 
 
-def test_deep_nested():
+def test_deep_nested(json_schema):
     """Test that deep nested schemas are in definitions."""
-
-    class InnerSchema(Schema):
-        boz = fields.Integer(required=True)
-
-    class InnerMiddleSchema(Schema):
-        baz = fields.Nested(InnerSchema, required=True)
-
-    class OuterMiddleSchema(Schema):
-        bar = fields.Nested(InnerMiddleSchema, required=True)
-
-    class OuterSchema(Schema):
-        foo = fields.Nested(OuterMiddleSchema, required=True)
-
-    schema = OuterSchema()
-    dumped = validate_and_dump(schema)
+    schema = DeepOuterSchema()
+    dumped = validate_and_dump(schema, json_schema)
 
     defs = dumped["definitions"]
-    assert "OuterSchema" in defs
-    assert "OuterMiddleSchema" in defs
-    assert "InnerMiddleSchema" in defs
-    assert "InnerSchema" in defs
-
-
-def test_respect_only_for_nested_schema():
-    """Should ignore fields not in 'only' metadata for nested schemas."""
-
-    class InnerRecursiveSchema(Schema):
-        id = fields.Integer(required=True)
-        baz = fields.String()
-        recursive = fields.Nested("InnerRecursiveSchema")
-
-    class MiddleSchema(Schema):
-        id = fields.Integer(required=True)
-        bar = fields.String()
-        inner = fields.Nested("InnerRecursiveSchema", only=("id", "baz"))
-
-    class OuterSchema(Schema):
-        foo2 = fields.Integer(required=True)
-        nested = fields.Nested("MiddleSchema")
-
-    schema = OuterSchema()
-    dumped = validate_and_dump(schema)
-    inner_props = dumped["definitions"]["InnerRecursiveSchema"]["properties"]
-    assert "recursive" not in inner_props
+    assert "DeepOuterSchema" in defs
+    assert "DeepOuterMiddleSchema" in defs
+    assert "DeepInnerMiddleSchema" in defs
+    assert "DeepInnerSchema" in defs
 
 
-def test_respect_exclude_for_nested_schema():
-    """Should ignore fields in 'exclude' metadata for nested schemas."""
+class InnerRecursiveSchema(Schema):
+    id = fields.Integer(required=True)
+    baz = fields.String()
+    recursive = fields.Nested("InnerRecursiveSchema")
 
-    class InnerRecursiveSchema(Schema):
-        id = fields.Integer(required=True)
-        baz = fields.String()
-        recursive = fields.Nested("InnerRecursiveSchema")
-
-    class MiddleSchema(Schema):
-        id = fields.Integer(required=True)
-        bar = fields.String()
-        inner = fields.Nested("InnerRecursiveSchema", exclude=("recursive",))
-
-    class OuterSchema(Schema):
-        foo2 = fields.Integer(required=True)
-        nested = fields.Nested("MiddleSchema")
-
-    schema = OuterSchema()
 
-    dumped = validate_and_dump(schema)
+class MiddleSchema(Schema):
+    id = fields.Integer(required=True)
+    bar = fields.String()
+    inner = fields.Nested("InnerRecursiveSchema")
 
-    inner_props = dumped["definitions"]["InnerRecursiveSchema"]["properties"]
-    assert "recursive" not in inner_props
 
+class OnlyMiddleSchema(Schema):
+    id = fields.Integer(required=True)
+    bar = fields.String()
+    inner = fields.Nested("InnerRecursiveSchema", only=("id", "baz"))
 
-def test_respect_dotted_exclude_for_nested_schema():
-    """Should ignore dotted fields in 'exclude' metadata for nested schemas."""
 
-    class InnerRecursiveSchema(Schema):
-        id = fields.Integer(required=True)
-        baz = fields.String()
-        recursive = fields.Nested("InnerRecursiveSchema")
+class ExcludeMiddleSchema(Schema):
+    id = fields.Integer(required=True)
+    bar = fields.String()
+    inner = fields.Nested("InnerRecursiveSchema", exclude=("recursive",))
 
-    class MiddleSchema(Schema):
-        id = fields.Integer(required=True)
-        bar = fields.String()
-        inner = fields.Nested("InnerRecursiveSchema")
 
-    class OuterSchema(Schema):
-        foo2 = fields.Integer(required=True)
-        nested = fields.Nested("MiddleSchema", exclude=("inner.recursive",))
-
-    schema = OuterSchema()
+@pytest.mark.parametrize(
+    ("middle_schema", "exclude"),
+    [
+        pytest.param(OnlyMiddleSchema, (), id="only"),
+        pytest.param(ExcludeMiddleSchema, (), id="exclude"),
+        pytest.param(MiddleSchema, ("inner.recursive",), id="dotted exclude"),
+    ],
+)
+def test_respect_only_and_exclude_for_nested_schema(middle_schema, exclude, json_schema):
+    """Should ignore fields left out by 'only' or 'exclude' metadata for nested schemas."""
+    schema = Schema.from_dict(
+        {"foo2": fields.Integer(required=True), "nested": fields.Nested(middle_schema, exclude=exclude)},
+        name="OuterSchema",
+    )()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     inner_props = dumped["definitions"]["InnerRecursiveSchema"]["properties"]
-    assert "recursive" not in inner_props
+    assert set(inner_props) == {"id", "baz"}
 
 
-def test_respect_default_for_nested_schema():
+def test_respect_default_for_nested_schema(json_schema):
     class TestNestedSchema(Schema):
         myfield = fields.String()
         yourfield = fields.Integer(required=True)
@@ -371,12 +353,12 @@ def test_respect_default_for_nested_schema():
         yourfield_nested = fields.Integer(required=True)
 
     schema = TestSchema()
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
     default = dumped["definitions"]["TestSchema"]["properties"]["nested"]["default"]
     assert default == nested_default
 
 
-def test_nested_instance():
+def test_nested_instance(json_schema):
     """Should also work with nested schema instances"""
 
     class TestNestedSchema(Schema):
@@ -388,7 +370,7 @@ def test_nested_instance():
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     nested_def = dumped["definitions"]["TestNestedSchema"]
     nested_obj = dumped["definitions"]["TestSchema"]["properties"]["bar"]
@@ -397,7 +379,7 @@ def test_nested_instance():
     assert nested_obj["$ref"] == "#/definitions/TestNestedSchema"
 
 
-def test_function():
+def test_function(json_schema):
     """Function fields can be serialised if type is given."""
 
     class FnSchema(Schema):
@@ -406,14 +388,14 @@ def test_function():
 
     schema = FnSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     props = dumped["definitions"]["FnSchema"]["properties"]
     assert props["fn_int"]["type"] == "number"
     assert props["fn_str"]["type"] == "string"
 
 
-def test_nested_recursive():
+def test_nested_recursive(json_schema):
     """A self-referential schema should not cause an infinite recurse."""
 
     class RecursiveSchema(Schema):
@@ -422,25 +404,25 @@ def test_nested_recursive():
 
     schema = RecursiveSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     props = dumped["definitions"]["RecursiveSchema"]["properties"]
     assert "RecursiveSchema" in props["children"]["items"]["$ref"]
 
 
-def test_title():
+def test_title(json_schema):
     class TestSchema(Schema):
         myfield = fields.String(metadata={"title": "Brown Cowzz"})
         yourfield = fields.Integer(required=True)
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     assert dumped["definitions"]["TestSchema"]["properties"]["myfield"]["title"] == "Brown Cowzz"
 
 
-def test_unknown_typed_field_throws_valueerror():
+def test_unknown_typed_field_throws_valueerror(json_schema):
     class Invalid(fields.Field):
         def _serialize(self, value, _attr, _obj):
             return value
@@ -449,13 +431,12 @@ def test_unknown_typed_field_throws_valueerror():
         favourite_colour = Invalid()
 
     schema = UserSchema()
-    json_schema = JSONSchema()
 
     with pytest.raises(UnsupportedValueError):
-        validate_and_dump(json_schema.dump(schema))
+        json_schema.dump(schema)
 
 
-def test_unknown_typed_field():
+def test_unknown_typed_field(json_schema):
     class Colour(fields.Field):
         def _jsonschema_type_mapping(self):
             return {"type": "string"}
@@ -470,12 +451,12 @@ def test_unknown_typed_field():
 
     schema = UserSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     assert dumped["definitions"]["UserSchema"]["properties"]["favourite_colour"] == {"type": "string"}
 
 
-def test_field_subclass():
+def test_field_subclass(json_schema):
     """JSON schema generation should not fail on sublcass marshmallow field."""
 
     class CustomField(fields.Field):
@@ -486,26 +467,36 @@ def test_field_subclass():
 
     schema = TestSchema()
     with pytest.raises(UnsupportedValueError):
-        _ = validate_and_dump(schema)
+        _ = validate_and_dump(schema, json_schema)
 
 
-def test_readonly():
+EXPECTED_READONLY_PROPERTY = {
+    "title": "readonly_fld",
+    "type": "string",
+    "readOnly": True,
+}
+
+
+def test_readonly(json_schema):
     class TestSchema(Schema):
         id = fields.Integer(required=True)
         readonly_fld = fields.String(dump_only=True)
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
-    assert dumped["definitions"]["TestSchema"]["properties"]["readonly_fld"] == {
-        "title": "readonly_fld",
-        "type": "string",
-        "readOnly": True,
-    }
+    assert dumped["definitions"]["TestSchema"]["properties"]["readonly_fld"] == EXPECTED_READONLY_PROPERTY
+
+
+EXPECTED_METADATA_FIELD_PROPERTY = {
+    "title": "metadata_field",
+    "type": "string",
+    "description": "Directly on the field!",
+}
 
 
-def test_metadata_direct_from_field():
+def test_metadata_direct_from_field(json_schema):
     """Should be able to get metadata without accessing metadata kwarg."""
 
     class TestSchema(Schema):
@@ -514,16 +505,18 @@ def test_metadata_direct_from_field():
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
-    assert dumped["definitions"]["TestSchema"]["properties"]["metadata_field"] == {
-        "title": "metadata_field",
-        "type": "string",
-        "description": "Directly on the field!",
-    }
+    assert dumped["definitions"]["TestSchema"]["properties"]["metadata_field"] == EXPECTED_METADATA_FIELD_PROPERTY
 
 
-def test_allow_none():
+EXPECTED_ALLOW_NONE_PROPERTY = {
+    "title": "readonly_fld",
+    "type": ["string", "null"],
+}
+
+
+def test_allow_none(json_schema):
     """A field with allow_none set to True should have type null as additional."""
 
     class TestSchema(Schema):
@@ -532,49 +525,50 @@ def test_allow_none():
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
-    assert dumped["definitions"]["TestSchema"]["properties"]["readonly_fld"] == {
-        "title": "readonly_fld",
-        "type": ["string", "null"],
-    }
+    assert dumped["definitions"]["TestSchema"]["properties"]["readonly_fld"] == EXPECTED_ALLOW_NONE_PROPERTY
 
 
-def test_dumps_iterable_enums():
-    mapping = {"a": 0, "b": 1, "c": 2}
+ITERABLE_ENUM_MAPPING = {"a": 0, "b": 1, "c": 2}
+EXPECTED_ITERABLE_ENUM_PROPERTY = {
+    "oneOf": [{"type": "integer", "title": k, "const": v} for k, v in ITERABLE_ENUM_MAPPING.items()],
+    "title": "foo",
+    "type": "integer",
+}
 
+
+def test_dumps_iterable_enums(json_schema):
     class TestSchema(Schema):
-        foo = fields.Integer(validate=validate.OneOf(mapping.values(), labels=mapping.keys()))
+        foo = fields.Integer(
+            validate=validate.OneOf(ITERABLE_ENUM_MAPPING.values(), labels=ITERABLE_ENUM_MAPPING.keys())
+        )
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
-    assert dumped["definitions"]["TestSchema"]["properties"]["foo"] == {
-        "oneOf": [{"type": "integer", "title": k, "const": v} for k, v in mapping.items()],
-        "title": "foo",
-        "type": "integer",
-    }
+    assert dumped["definitions"]["TestSchema"]["properties"]["foo"] == EXPECTED_ITERABLE_ENUM_PROPERTY
 
 
-def test_required_excluded_when_empty():
+def test_required_excluded_when_empty(json_schema):
     class TestSchema(Schema):
         optional_value = fields.String()
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     assert "required" not in dumped["definitions"]["TestSchema"]
 
 
-def test_required_uses_data_key():
+def test_required_uses_data_key(json_schema):
     class TestSchema(Schema):
         optional_value = fields.String(data_key="opt", required=True)
 
     schema = TestSchema()
 
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
 
     test_schema_definition = dumped["definitions"]["TestSchema"]
     assert "opt" in test_schema_definition["properties"]
@@ -583,60 +577,60 @@ def test_required_uses_data_key():
     assert "opt" in test_schema_definition["required"]
 
 
-def test_datetime_based():
-    class TestSchema(Schema):
-        f_date = fields.Date()
-        f_datetime = fields.DateTime()
-        f_time = fields.Time()
-
-    schema = TestSchema()
-
-    dumped = validate_and_dump(schema)
-
-    assert dumped["definitions"]["TestSchema"]["properties"]["f_date"] == {
+EXPECTED_DATETIME_PROPERTIES = {
+    "f_date": {
         "format": "date",
         "title": "f_date",
         "type": "string",
-    }
-
-    assert dumped["definitions"]["TestSchema"]["properties"]["f_datetime"] == {
+    },
+    "f_datetime": {
         "format": "date-time",
         "title": "f_datetime",
         "type": "string",
-    }
-
-    assert dumped["definitions"]["TestSchema"]["properties"]["f_time"] == {
+    },
+    "f_time": {
         "format": "time",
         "title": "f_time",
         "type": "string",
-    }
+    },
+}
 
 
-def test_sorting_properties():
+def test_datetime_based(json_schema):
     class TestSchema(Schema):
-        class Meta:
-            ordered = True
-
-        d = fields.Str()
-        c = fields.Str()
-        a = fields.Str()
+        f_date = fields.Date()
+        f_datetime = fields.DateTime()
+        f_time = fields.Time()
 
-    # Should be sorting of fields
     schema = TestSchema()
 
-    json_schema = JSONSchema()
+    dumped = validate_and_dump(schema, json_schema)
+
+    assert dumped["definitions"]["TestSchema"]["properties"] == EXPECTED_DATETIME_PROPERTIES
+
+
+class OrderedSchema(Schema):
+    class Meta:
+        ordered = True
+
+    d = fields.Str()
+    c = fields.Str()
+    a = fields.Str()
+
+
+def test_sorting_properties(json_schema):
+    schema = OrderedSchema()
+
+    # Should be sorting of fields
     data = json_schema.dump(schema)
 
-    sorted_keys = sorted(data["definitions"]["TestSchema"]["properties"].keys())
+    sorted_keys = sorted(data["definitions"]["OrderedSchema"]["properties"].keys())
     assert list(sorted_keys) == ["a", "c", "d"]
 
     # Should be saving ordering of fields
-    schema = TestSchema()
-
-    json_schema = JSONSchema(props_ordered=True)
-    data = json_schema.dump(schema)
+    data = JSONSchema(props_ordered=True).dump(schema)
 
-    keys = data["definitions"]["TestSchema"]["properties"].keys()
+    keys = data["definitions"]["OrderedSchema"]["properties"].keys()
 
     assert list(keys) == ["d", "c", "a"]
 
@@ -647,6 +641,18 @@ class TestEnum(Enum):
     value_3 = "2"
 
 
+ENUM_FIELD_CLASSES = [
+    pytest.param(MarshmallowEnumEnumField, id="Lib Enum (deprecated)"),
+    pytest.param(
+        MarshmallowNativeEnumField,
+        id="Native Enum",
+        marks=pytest.mark.skipif(
+            not TEST_MARSHMALLOW_NATIVE_ENUM, reason="marshmallow < 3.18 doesn't support native enums"
+        ),
+    ),
+]
+
+
 @pytest.mark.parametrize(
     ("field_type", "validation", "matches", "unsupported"),
     [
@@ -667,20 +673,8 @@ class TestEnum(Enum):
         ),  # oneOf not supported for list fields, remains an enum
     ],
 )
-@pytest.mark.parametrize(
-    "enum_cls",
-    [
-        pytest.param(MarshmallowEnumEnumField, id="Lib Enum (deprecated)"),
-        pytest.param(
-            MarshmallowNativeEnumField,
-            id="Native Enum",
-            marks=pytest.mark.skipif(
-                not TEST_MARSHMALLOW_NATIVE_ENUM, reason="marshmallow < 3.18 doesn't support native enums"
-            ),
-        ),
-    ],
-)
-def test_marshmallow_enums(enum_cls, field_type, validation, matches, unsupported):
+@pytest.mark.parametrize("enum_cls", ENUM_FIELD_CLASSES)
+def test_marshmallow_enums(enum_cls, field_type, validation, matches, unsupported, json_schema):  # noqa: PLR0913
     """
     Testing the two types of enums we support although the lib version is deprecated.
     Also checking compatability with oneOf validation as it causes invalid schemas if both are set
@@ -697,7 +691,6 @@ def test_marshmallow_enums(enum_cls, field_type, validation, matches, unsupporte
     # Should be sorting of fields
     schema = TestSchema()
 
-    json_schema = JSONSchema()
     data = json_schema.dump(schema)
 
     field = data["definitions"]["TestSchema"]["properties"]["enum_prop"]
@@ -720,46 +713,34 @@ def test_marshmallow_enums(enum_cls, field_type, validation, matches, unsupporte
         ]
 
 
-def test_marshmallow_enum_enum_based_load_dump_value():
-    class TestEnum(Enum):
-        value_1 = 0
-        value_2 = 1
-        value_3 = 2
-
-    class TestSchema(Schema):
-        enum_prop = MarshmallowEnumEnumField(TestEnum, by_value=True)
-
-    # Should be sorting of fields
-    schema = TestSchema()
-
-    json_schema = JSONSchema()
+@pytest.mark.parametrize("enum_cls", ENUM_FIELD_CLASSES)
+def test_marshmallow_enums_load_dump_value(enum_cls, json_schema):
+    schema = Schema.from_dict({"enum_prop": enum_cls(TestEnum, by_value=True)}, name="TestSchema")()
 
     with pytest.raises(NotImplementedError):
-        validate_and_dump(json_schema.dump(schema))
+        json_schema.dump(schema)
 
 
-def test_native_marshmallow_enum_based_load_dump_value():
-    if not TEST_MARSHMALLOW_NATIVE_ENUM:
-        return
+@pytest.mark.parametrize("enum_cls", ENUM_FIELD_CLASSES)
+def test_marshmallow_enums_python_type_override(enum_cls, json_schema):
+    metadata = {"jsonschema_python_type": str}
+    schema = Schema.from_dict({"enum_prop": enum_cls(TestEnum, metadata=metadata)}, name="TestSchema")()
 
-    class TestEnum(Enum):
-        value_1 = 0
-        value_2 = 1
-        value_3 = 2
-
-    class TestSchema(Schema):
-        enum_prop = MarshmallowNativeEnumField(TestEnum, by_value=True)
+    dumped = validate_and_dump(schema, json_schema)
 
-    # Should be sorting of fields
-    schema = TestSchema()
+    assert dumped["definitions"]["TestSchema"]["properties"]["enum_prop"] == {
+        "title": "enum_prop",
+        "type": "string",
+        "enum": ["value_1", "value_2", "value_3"],
+    }
 
-    json_schema = JSONSchema()
+    schema = Schema.from_dict({"enum_prop": enum_cls(TestEnum, by_value=True, metadata=metadata)}, name="TestSchema")()
 
     with pytest.raises(NotImplementedError):
-        validate_and_dump(json_schema.dump(schema))
+        json_schema.dump(schema)
 
 
-def test_union_based():
+def test_union_based(json_schema):
     class TestNestedSchema(Schema):
         field_1 = fields.String()
         field_2 = fields.Integer()
@@ -770,15 +751,15 @@ def test_union_based():
     # Should be sorting of fields
     schema = TestSchema()
 
-    json_schema = JSONSchema()
     data = json_schema.dump(schema)
 
+    union_prop = data["definitions"]["TestSchema"]["properties"]["union_prop"]
+
     # Expect only the `anyOf` key
-    assert "anyOf" in data["definitions"]["TestSchema"]["properties"]["union_prop"]
-    assert len(data["definitions"]["TestSchema"]["properties"]["union_prop"]) == 1
+    assert list(union_prop) == ["anyOf"]
 
     string_schema = {"type": "string", "title": ""}
-    integer_schema = {"type": "string", "title": ""}
+    integer_schema = {"type": "integer", "title": ""}
     referenced_nested_schema = {
         "type": "object",
         "$ref": "#/definitions/TestNestedSchema",
@@ -792,20 +773,20 @@ def test_union_based():
         "additionalProperties": False,
     }
 
-    assert string_schema in data["definitions"]["TestSchema"]["properties"]["union_prop"]["anyOf"]
-    assert integer_schema in data["definitions"]["TestSchema"]["properties"]["union_prop"]["anyOf"]
-    assert referenced_nested_schema in data["definitions"]["TestSchema"]["properties"]["union_prop"]["anyOf"]
+    # Expect exactly these three possible schemas for the union type
+    any_of = union_prop["anyOf"]
+    assert len(any_of) == 3
+    assert {frozenset(d.items()) for d in any_of} == {
+        frozenset(d.items()) for d in (string_schema, integer_schema, referenced_nested_schema)
+    }
 
     assert data["definitions"]["TestNestedSchema"] == actual_nested_schema
-    # Expect three possible schemas for the union type
-    assert len(data["definitions"]["TestSchema"]["properties"]["union_prop"]["anyOf"]) == 3
 
 
-def test_dumping_recursive_schema():
+def test_dumping_recursive_schema(json_schema):
     """
     this reproduces issue https://github.com/fuhrysteve/marshmallow-jsonschema/issues/164
     """
-    json_schema = JSONSchema()
 
     def generate_recursive_schema_with_name():
         class RecursiveSchema(Schema):
@@ -826,113 +807,100 @@ def test_dumping_recursive_schema():
     assert lambda_schema == name_schema
 
 
-def test_basic_dataclass():
+EXPECTED_BASIC_DATACLASS = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "definitions": {
+        "BasicDataClass": {
+            "properties": {
+                "field_1": {"title": "field_1", "type": "integer"},
+                "field_2": {"title": "field_2", "type": "string"},
+                "field_3": {
+                    "title": "field_3",
+                    "type": "array",
+                    "items": {"title": "field_3", "type": "string"},
+                },
+            },
+            "type": "object",
+            "required": ["field_1", "field_2", "field_3"],
+            "additionalProperties": False,
+        }
+    },
+    "$ref": "#/definitions/BasicDataClass",
+}
+
+
+def test_basic_dataclass(json_schema):
     """
     Tests whether a dataclass (using @dataclass) can be transformed into a jsonschema
     using marshmallow-dataclass and JSONSchema.dump()
     """
-    expected_data = {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "definitions": {
-            "TestDataClass": {
-                "properties": {
-                    "field_1": {"title": "field_1", "type": "integer"},
-                    "field_2": {"title": "field_2", "type": "string"},
-                    "field_3": {
-                        "title": "field_3",
-                        "type": "array",
-                        "items": {"title": "field_3", "type": "string"},
-                    },
-                },
-                "type": "object",
-                "required": ["field_1", "field_2", "field_3"],
-                "additionalProperties": False,
-            }
-        },
-        "$ref": "#/definitions/TestDataClass",
-    }
-    json_schema = JSONSchema()
-
-    @dataclass
-    class TestDataClass:
-        field_1: int
-        field_2: str
-        field_3: list[str]
 
-    marshmallow_dataclass = class_schema(TestDataClass)()
+    marshmallow_dataclass = class_schema(BasicDataClass)()
 
     data = json_schema.dump(marshmallow_dataclass)
-    assert data == expected_data
-
-
-def test_union_dataclass():
+    assert data == EXPECTED_BASIC_DATACLASS
+
+
+EXPECTED_UNION_DATACLASS = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "definitions": {
+        "UnionDataClass": {
+            "properties": {
+                "field_1": {
+                    "anyOf": [
+                        {"title": "field_1", "type": "integer"},
+                        {"title": "field_1", "type": "string"},
+                    ]
+                }
+            },
+            "type": "object",
+            "additionalProperties": False,
+        }
+    },
+    "$ref": "#/definitions/UnionDataClass",
+}
+
+
+def test_union_dataclass(json_schema):
     """
     Tests whether a dataclass with a variable with a union type (e.g. int | str)
     translates well through JSONSchema.dump()
     """
-    expected_data = {
-        "$schema": "http://json-schema.org/draft-07/schema#",
-        "definitions": {
-            "TestDataClass": {
-                "properties": {
-                    "field_1": {
-                        "anyOf": [
-                            {"title": "field_1", "type": "integer"},
-                            {"title": "field_1", "type": "string"},
-                        ]
-                    }
-                },
-                "type": "object",
-                "additionalProperties": False,
-            }
-        },
-        "$ref": "#/definitions/TestDataClass",
-    }
-    json_schema = JSONSchema()
 
-    @dataclass
-    class TestDataClass:
-        field_1: int | str | None
-
-    marshmallow_dataclass = class_schema(TestDataClass)()
+    marshmallow_dataclass = class_schema(UnionDataClass)()
     data = json_schema.dump(marshmallow_dataclass)
-    assert data == expected_data
+    assert data == EXPECTED_UNION_DATACLASS
 
 
-def test_nested_dataclass():
+def test_nested_dataclass(json_schema):
     """
     Tests whether a dataclass with an internally defined dataclass translates well through JSONSchema.dump(), meaning
     both dataclasses should come out the other side.
     """
 
-    @dataclass
-    class SubDataClass:
-        foo: int
-        bar: list[int | str]
-
-    @dataclass
-    class TestDataClass:
-        subclass: SubDataClass
-        other: str
-
-    marshmallow_dataclass = class_schema(TestDataClass)()
-    data = JSONSchema().dump(marshmallow_dataclass)
+    marshmallow_dataclass = class_schema(NestedDataClass)()
+    data = json_schema.dump(marshmallow_dataclass)
 
-    assert data["definitions"]["SubDataClass"]["type"] == "object"
-    assert data["definitions"]["SubDataClass"]["properties"]["bar"]["items"] == {
+    sub_definition = data["definitions"]["SubDataClass"]
+    assert sub_definition["type"] == "object"
+    sub_props = sub_definition["properties"]
+    assert sub_props["bar"]["items"] == {
         "anyOf": [{"title": "bar", "type": "integer"}, {"title": "bar", "type": "string"}]
     }
-    assert data["definitions"]["SubDataClass"]["properties"]["foo"] == {"title": "foo", "type": "integer"}
-    assert data["definitions"]["TestDataClass"]["type"] == "object"
-    assert data["definitions"]["TestDataClass"]["properties"]["other"] == {"title": "other", "type": "string"}
-    assert data["definitions"]["TestDataClass"]["properties"]["subclass"] == {
+    assert sub_props["foo"] == {"title": "foo", "type": "integer"}
+
+    nested_definition = data["definitions"]["NestedDataClass"]
+    assert nested_definition["type"] == "object"
+    nested_props = nested_definition["properties"]
+    assert nested_props["other"] == {"title": "other", "type": "string"}
+    assert nested_props["subclass"] == {
         "type": "object",
         "$ref": "#/definitions/SubDataClass",
     }
-    assert data["definitions"]["TestDataClass"]["required"] == ["other", "subclass"]
+    assert nested_definition["required"] == ["other", "subclass"]
 
 
-def test_customfield_metadata_jsonschema_python_type():
+def test_customfield_metadata_jsonschema_python_type(json_schema):
     """
     NOTE: calculating additional metadata not currently in use
     Tests that specifying the equivalent pytpe in the metadata works for a custom field, and produces
@@ -958,7 +926,7 @@ def test_customfield_metadata_jsonschema_python_type():
         custom_field_jsonschema_type = CustomFieldJSONSchemaType()
 
     schema = UserSchema()
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
     props = dumped["definitions"]["UserSchema"]["properties"]
 
     assert props["custom_field_pytpe"] == {"title": "custom_field_pytpe", "type": "string"}
@@ -966,7 +934,7 @@ def test_customfield_metadata_jsonschema_python_type():
     assert props["custom_field_jsonschema_type"] == {"type": "string"}
 
 
-def test_customfield_metadata_pytype_mapping_overrides_jsonschema_type_mapping():
+def test_customfield_metadata_pytype_mapping_overrides_jsonschema_type_mapping(json_schema):
     """
     Test that if using pytpe mapping in metadata, that this overwrites the deprecated
     _jsonschema_type_mapping function if also provided.
@@ -984,102 +952,123 @@ def test_customfield_metadata_pytype_mapping_overrides_jsonschema_type_mapping()
         custom_field = CustomField()
 
     schema = UserSchema()
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
     expected_schema = {"title": "custom_field", "type": "string"}
     assert dumped["definitions"]["UserSchema"]["properties"]["custom_field"] == expected_schema
 
 
-def test_jsonschema_schema_passed_through():
+class CustomIntSchemaGiven(fields.Field):
+    def _jsonschema_type_mapping(self):
+        return {
+            "type": "integer",
+            "default": 7,
+            "description": "Custom description",
+            "title": "CustomInt",
+        }
+
+
+class SchemaGiven(Schema):
+    custom_field = CustomIntSchemaGiven(
+        default=7,
+        metadata={"description": "modified description", "title": "CustomInt"},
+    )
+
+
+class CustomInt(fields.Field):
+    def _jsonschema_type_mapping(self):
+        return {"type": "integer", "description": "Custom description"}
+
+
+class SchemaInferred(Schema):
+    custom_field = CustomInt(
+        default=7,
+        metadata={"description": "Custom description", "title": "CustomInt"},
+    )
+
+
+class PassedThroughSchema(Schema):
+    schema_given = fields.Nested(SchemaGiven())
+    schema_inferred = fields.Nested(SchemaInferred())
+
+
+EXPECTED_GIVEN_PROPERTY = {
+    "default": 7,
+    "description": "Custom description",
+    "title": "CustomInt",
+    "type": "integer",
+}
+# Inferred won't currently collect the extra bits of metadata (default, title)
+EXPECTED_INFERRED_PROPERTY = {
+    "description": "Custom description",
+    "type": "integer",
+}
+
+
+def test_jsonschema_schema_passed_through(json_schema):
     """
     NOTE: calculating additional metadata not currently in use
     Test for backwards compatibility, with changed behaviour of _jsonschema_type_mapping.
     If entire schema has been provided in _jsonschema_type_mapping, test that it still
     dumps as expected.
     """
+    schema = PassedThroughSchema()
+    dumped = validate_and_dump(schema, json_schema)
+    assert dumped["definitions"]["SchemaGiven"]["properties"]["custom_field"] == EXPECTED_GIVEN_PROPERTY
+    assert dumped["definitions"]["SchemaInferred"]["properties"]["custom_field"] == EXPECTED_INFERRED_PROPERTY
 
-    class CustomIntSchemaGiven(fields.Field):
-        def _jsonschema_type_mapping(self):
-            return {
-                "type": "integer",
-                "default": 7,
-                "description": "Custom description",
-                "title": "CustomInt",
-            }
-
-    class SchemaGiven(Schema):
-        custom_field = CustomIntSchemaGiven(
-            default=7,
-            metadata={"description": "modified description", "title": "CustomInt"},
-        )
 
-    class CustomInt(fields.Field):
-        def _jsonschema_type_mapping(self):
-            return {"type": "integer", "description": "Custom description"}
+# Read-only metadata shared by the fields of the schemas below (marshmallow copies it into each field)
+FLOAT_ARRAY_METADATA = MappingProxyType({"title": "Float array"})
+DICT_FIELD_METADATA = MappingProxyType({"title": "dict field"})
 
-    class SchemaInferred(Schema):
-        custom_field = CustomInt(
-            default=7,
-            metadata={"description": "Custom description", "title": "CustomInt"},
-        )
+# Shared inner fields, containers deep-copy them when bound to a schema so reuse is safe
+FLOAT_FIELD = fields.Float()
+STRING_FIELD = fields.String()
+INTEGER_FIELD = fields.Integer()
 
-    class UserSchema(Schema):
-        schema_given = fields.Nested(SchemaGiven())
-        schema_inferred = fields.Nested(SchemaInferred())
 
-    schema = UserSchema()
-    dumped = validate_and_dump(schema)
-    expected_schema = {
-        "default": 7,
-        "description": "Custom description",
-        "title": "CustomInt",
-        "type": "integer",
-    }
-    assert dumped["definitions"]["SchemaGiven"]["properties"]["custom_field"] == expected_schema
-    del expected_schema["default"]  # inferred won't currently collect these extra bits of metadata
-    del expected_schema["title"]
-    assert dumped["definitions"]["SchemaInferred"]["properties"]["custom_field"] == expected_schema
+class CustomFloat(fields.Field):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metadata["jsonschema_python_type"] = float
 
 
-def test_custom_list_inner_custom_field():
-    """
-    Test that custom lists, inner fields are captured correctly
-    """
+CUSTOM_FLOAT_FIELD = CustomFloat()
 
-    class CustomFloat(fields.Field):
-        def __init__(self, **kwargs):
-            super().__init__(**kwargs)
-            self.metadata["jsonschema_python_type"] = float
 
-    class NestedCustomList(fields.List):
-        def __init__(self, **kwargs):
-            super().__init__(CustomFloat(), **kwargs)
+class NestedCustomList(fields.List):
+    def __init__(self, **kwargs):
+        super().__init__(CUSTOM_FLOAT_FIELD, **kwargs)
 
-    class CustomList(fields.List):
-        def __init__(self, **kwargs):
-            super().__init__(fields.Float, **kwargs)
 
-    class UserSchema(Schema):
-        normal_list = fields.List(fields.Float, metadata={"title": "Float array"})
-        normal_list_custom_inner = fields.List(CustomFloat, metadata={"title": "Float array"})
-        custom_list = CustomList(metadata={"title": "Float array"})
-        custom_list_custom_inner = NestedCustomList(metadata={"title": "Float array"})
+class CustomList(fields.List):
+    def __init__(self, **kwargs):
+        super().__init__(FLOAT_FIELD, **kwargs)
 
-    schema = UserSchema()
-    dumped = validate_and_dump(schema)
-    props = dumped["definitions"]["UserSchema"]["properties"]
-    # The title in "items" should be only difference between each of the properties, remove for comparison
-    for field_schema in props.values():
-        field_schema["items"].pop("title", None)
-
-    assert (
-        props["normal_list"]
-        == props["custom_list"]
-        == props["normal_list_custom_inner"]
-        == props["custom_list_custom_inner"]
-    )
+
+class CustomListSchema(Schema):
+    normal_list = fields.List(FLOAT_FIELD, metadata=FLOAT_ARRAY_METADATA)
+    # Given as a class, to cover the list instantiating its inner field itself
+    normal_list_custom_inner = fields.List(CustomFloat, metadata=FLOAT_ARRAY_METADATA)
+    custom_list = CustomList(metadata=FLOAT_ARRAY_METADATA)
+    custom_list_custom_inner = NestedCustomList(metadata=FLOAT_ARRAY_METADATA)
 
 
-def test_custom_field_type():
+def test_custom_list_inner_custom_field(json_schema):
+    """
+    Test that custom lists, inner fields are captured correctly
+    """
+    schema = CustomListSchema()
+    dumped = validate_and_dump(schema, json_schema)
+    props = dumped["definitions"]["CustomListSchema"]["properties"]
+    # The title in "items" (the field name) should be the only difference between each of the properties
+    assert props == {
+        name: {"title": "Float array", "type": "array", "items": {"title": name, "type": "number", "format": "float"}}
+        for name in ("normal_list", "normal_list_custom_inner", "custom_list", "custom_list_custom_inner")
+    }
+
+
+def test_custom_field_type(json_schema):
     """
     Test that jsonschema_python_type can also accept valid field types
     Note it won't accept Union or Enum types as these are handled outside the type logic
@@ -1094,57 +1083,48 @@ def test_custom_field_type():
         custom_uuid = CustomUuid(metadata={"title": "Complex"})
 
     schema = UserSchema()
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
     props = dumped["definitions"]["UserSchema"]["properties"]
     assert props["custom_uuid"] == {"format": "uuid", "title": "Complex", "type": "string"}
 
 
-def test_custom_dict_custom_values():
-    """
-    Test that custom dicts, keys and values are captured correctly
-    """
+class CustomKey(fields.Field):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metadata["jsonschema_python_type"] = str
 
-    class CustomKey(fields.Field):
-        def __init__(self, **kwargs):
-            super().__init__(**kwargs)
-            self.metadata["jsonschema_python_type"] = str
 
-    class CustomValue(fields.Field):
-        def __init__(self, **kwargs):
-            super().__init__(**kwargs)
-            self.metadata["jsonschema_python_type"] = int
+class CustomValue(fields.Field):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.metadata["jsonschema_python_type"] = int
 
-    class CustomDict(fields.Dict):
-        def __init__(self, keys, values, **kwargs):
-            super().__init__(keys=keys, values=values, **kwargs)
 
-    class UserSchema(Schema):
-        normal_dict = fields.Dict(keys=fields.String, values=fields.Integer, metadata={"title": "dict field"})
-        normal_dict_custom_values = fields.Dict(
-            keys=fields.String, values=CustomValue(), metadata={"title": "dict field"}
-        )
-        normal_dict_custom_keys = fields.Dict(keys=CustomKey(), values=fields.Integer, metadata={"title": "dict field"})
-        normal_dict_custom_items = fields.Dict(keys=CustomKey(), values=CustomValue(), metadata={"title": "dict field"})
-        custom_dict = CustomDict(keys=fields.String, values=fields.Integer, metadata={"title": "dict field"})
-        custom_dict_custom_values = CustomDict(
-            keys=fields.String, values=CustomValue(), metadata={"title": "dict field"}
-        )
-        custom_dict_custom_keys = CustomDict(keys=CustomKey(), values=fields.Integer, metadata={"title": "dict field"})
-        custom_dict_custom_items = CustomDict(keys=CustomKey(), values=CustomValue(), metadata={"title": "dict field"})
+class CustomDict(fields.Dict):
+    def __init__(self, keys, values, **kwargs):
+        super().__init__(keys=keys, values=values, **kwargs)
 
-    schema = UserSchema()
-    dumped = validate_and_dump(schema)
-    props = dumped["definitions"]["UserSchema"]["properties"]
-    props_list = []
-    # The title in "additionalProperties" should be only diff between each of the properties, remove for comparison
-    for field_schema in props.values():
-        field_schema["additionalProperties"].pop("title", None)
-        props_list.append(field_schema)
 
-    assert all(d == props_list[0] for d in props_list)
+@pytest.mark.parametrize("dict_cls", [fields.Dict, CustomDict])
+@pytest.mark.parametrize("key_field", [STRING_FIELD, CustomKey()], ids=["key", "custom key"])
+@pytest.mark.parametrize("value_field", [INTEGER_FIELD, CustomValue()], ids=["value", "custom value"])
+def test_custom_dict_custom_values(dict_cls, key_field, value_field, json_schema):
+    """
+    Test that custom dicts, keys and values are captured correctly
+    """
+    dict_field = dict_cls(keys=key_field, values=value_field, metadata=DICT_FIELD_METADATA)
+    schema = Schema.from_dict({"foo": dict_field}, name="DictSchema")()
+
+    dumped = validate_and_dump(schema, json_schema)
+
+    assert dumped["definitions"]["DictSchema"]["properties"]["foo"] == {
+        "title": "dict field",
+        "type": "object",
+        "additionalProperties": {"title": "foo", "type": "integer"},
+    }
 
 
-def test_custom_jsonschema_python_type_list_items_exists():
+def test_custom_jsonschema_python_type_list_items_exists(json_schema):
     """
     When a custom fields.Field instance is used with jsonschema_python_type=list or _jsonschema_type_mapping "array",
     an empty "items" schema should be present.
@@ -1183,22 +1163,24 @@ def test_custom_jsonschema_python_type_list_items_exists():
         jsonschema_field_inner = JsonSchemaTypeFieldWithInner(inner_field=fields.String())
 
     schema = UserSchema()
-    dumped = validate_and_dump(schema)
-    pytype_prop = dumped["definitions"]["UserSchema"]["properties"]["custom_field"]
-    jsonschema_prop = dumped["definitions"]["UserSchema"]["properties"]["jsonschema_field"]
-    pytype_inner_prop = dumped["definitions"]["UserSchema"]["properties"]["custom_field_inner"]
-    jsonschema_inner_prop = dumped["definitions"]["UserSchema"]["properties"]["jsonschema_field_inner"]
-    for nested_json in (pytype_prop, jsonschema_prop):
-        assert nested_json["type"] == "array"
-        assert "items" in nested_json
-        assert nested_json["items"] == {}
-    for nested_json in (pytype_inner_prop, jsonschema_inner_prop):
-        assert nested_json["type"] == "array"
-        assert "items" in nested_json
-        assert nested_json["items"] == {"title": "", "type": "string"}
-
-
-def test_custom_jsonschema_python_type_dict_additional_properties_exists():
+    dumped = validate_and_dump(schema, json_schema)
+    assert dumped["definitions"]["UserSchema"]["properties"] == {
+        "custom_field": {"title": "custom_field", "type": "array", "items": {}},
+        "jsonschema_field": {"title": "jsonschema_field", "type": "array", "items": {}},
+        "custom_field_inner": {
+            "title": "custom_field_inner",
+            "type": "array",
+            "items": {"title": "", "type": "string"},
+        },
+        "jsonschema_field_inner": {
+            "title": "jsonschema_field_inner",
+            "type": "array",
+            "items": {"title": "", "type": "string"},
+        },
+    }
+
+
+def test_custom_jsonschema_python_type_dict_additional_properties_exists(json_schema):
     """
     When a custom fields.Field instance is used with jsonschema_python_type=dict or _jsonschema_type_mapping "object",
     an empty "additionalProperties" schema should be present
@@ -1236,22 +1218,24 @@ def test_custom_jsonschema_python_type_dict_additional_properties_exists():
         jsonschema_field_value = JsonSchemaTypeFieldWithValueField(value_field=fields.String())
 
     schema = UserSchema()
-    dumped = validate_and_dump(schema)
-    pytype_prop = dumped["definitions"]["UserSchema"]["properties"]["custom_field"]
-    jsonschema_prop = dumped["definitions"]["UserSchema"]["properties"]["jsonschema_field"]
-    pytype_value_prop = dumped["definitions"]["UserSchema"]["properties"]["custom_field_value"]
-    jsonschema_value_prop = dumped["definitions"]["UserSchema"]["properties"]["jsonschema_field_value"]
-    for nested_json in (pytype_prop, jsonschema_prop):
-        assert nested_json["type"] == "object"
-        assert "additionalProperties" in nested_json
-        assert nested_json["additionalProperties"] == {}
-    for nested_json in (pytype_value_prop, jsonschema_value_prop):
-        assert nested_json["type"] == "object"
-        assert "additionalProperties" in nested_json
-        assert nested_json["additionalProperties"] == {"title": "", "type": "string"}
-
-
-def test_can_have_custom_field_schema_without_type():
+    dumped = validate_and_dump(schema, json_schema)
+    assert dumped["definitions"]["UserSchema"]["properties"] == {
+        "custom_field": {"title": "custom_field", "type": "object", "additionalProperties": {}},
+        "jsonschema_field": {"title": "jsonschema_field", "type": "object", "additionalProperties": {}},
+        "custom_field_value": {
+            "title": "custom_field_value",
+            "type": "object",
+            "additionalProperties": {"title": "", "type": "string"},
+        },
+        "jsonschema_field_value": {
+            "title": "jsonschema_field_value",
+            "type": "object",
+            "additionalProperties": {"title": "", "type": "string"},
+        },
+    }
+
+
+def test_can_have_custom_field_schema_without_type(json_schema):
     class JsonSchemaEvilField(fields.Field):
         def _jsonschema_type_mapping(self):
             return {"evil_field": "true"}
@@ -1260,11 +1244,11 @@ def test_can_have_custom_field_schema_without_type():
         custom_field = JsonSchemaEvilField()
 
     schema = UserSchema()
-    dumped = validate_and_dump(schema)
+    dumped = validate_and_dump(schema, json_schema)
     assert dumped["definitions"]["UserSchema"]["properties"]["custom_field"] == {"evil_field": "true"}
 
 
-def test_jsonschema_type_mapping_must_be_a_dictionary():
+def test_jsonschema_type_mapping_must_be_a_dictionary(json_schema):
     class JsonSchemaBrokenField(fields.Field):
         def _jsonschema_type_mapping(self):
             return "list"
@@ -1274,7 +1258,7 @@ def test_jsonschema_type_mapping_must_be_a_dictionary():
 
     schema = UserSchema()
     with pytest.raises(UnsupportedValueError) as e:
-        validate_and_dump(schema)
+        validate_and_dump(schema, json_schema)
     assert str(e.value) == "_jsonschema_type_mapping should be a dictionary, received 'list' for field 'custom_field'"
 
 
@@ -1299,3 +1283,164 @@ def test_field_pytype_errors(field_type, msg):
     with pytest.raises(UnsupportedValueError) as e:
         JSONSchema._get_python_type(field)
     assert str(e.value) == f"{msg}, in 'mapped'"
+
+
+def test_python_type_cached_per_field_class(json_schema):
+    class CustomInteger(fields.Integer):
+        pass
+
+    class TestSchema(Schema):
+        foo = CustomInteger()
+
+    # dumped twice, as the python type of a field class is only resolved on the first dump
+    for _ in range(2):
+        dumped = validate_and_dump(TestSchema(), json_schema)
+        assert dumped["definitions"]["TestSchema"]["properties"]["foo"] == {"title": "foo", "type": "integer"}
+
+
+def test_schema_class_fields_resolved_once(json_schema):
+    instantiations = []
+
+    class TestSchema(Schema):
+        foo = fields.Integer(required=True)
+
+        def __init__(self, *args, **kwargs):
+            instantiations.append(self)
+            super().__init__(*args, **kwargs)
+
+    assert list(json_schema.get_properties(TestSchema)) == ["foo"]
+    assert json_schema.get_required(TestSchema) == ["foo"]
+    assert len(instantiations) == 1
+
+
+@pytest.mark.parametrize(
+    ("field", "expected"),
+    [
+        (fields.String(), {"title": "foo", "type": "string"}),
+        (fields.Nested(DeepInnerSchema), {"type": "object", "$ref": "#/definitions/DeepInnerSchema"}),
+        (
+            Union([fields.String(), fields.Integer()]),
+            {"anyOf": [{"title": "", "type": "string"}, {"title": "", "type": "integer"}]},
+        ),
+    ],
+    ids=["plain", "nested", "union"],
+)
+def test_field_kind(field, expected, json_schema):
+    schema = Schema.from_dict({"foo": field}, name="TestSchema")()
+
+    # dumped twice, as the kind of field is only worked out on the first dump
+    for _ in range(2):
+        dumped = validate_and_dump(schema, json_schema)
+        assert dumped["definitions"]["TestSchema"]["properties"]["foo"] == expected
+
+
+def test_legacy_nested_metadata_not_mutated(json_schema):
+    class TestSchema(Schema):
+        myfield = fields.String(metadata={"metadata": {"description": "Brown Cow"}, "foo": "Bar"})
+
+    schema = TestSchema()
+
+    dumped = validate_and_dump(schema, json_schema)
+
+    props = dumped["definitions"]["TestSchema"]["properties"]
+    assert props["myfield"] == {"title": "myfield", "type": "string", "description": "Brown Cow", "foo": "Bar"}
+    assert schema.fields["myfield"].metadata["metadata"] == {"description": "Brown Cow"}
+
+
+def test_allow_none_types_not_shared(json_schema):
+    class TestSchema(Schema):
+        first = fields.String(allow_none=True)
+        second = fields.String(allow_none=True)
+
+    dumped = validate_and_dump(TestSchema(), json_schema)
+
+    props = dumped["definitions"]["TestSchema"]["properties"]
+    props["first"]["type"].append("integer")
+    assert props["second"]["type"] == ["string", "null"]
+
+
+def test_jsonschema_type_mapping_instance_attribute(json_schema):
+    class CustomField(fields.Field):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self._jsonschema_type_mapping = {"type": "string"}
+
+    class TestSchema(Schema):
+        custom_field = CustomField()
+
+    dumped = validate_and_dump(TestSchema(), json_schema)
+
+    assert dumped["definitions"]["TestSchema"]["properties"]["custom_field"] == {"type": "string"}
+
+
+def test_required_sorted_with_ordered_properties():
+    class TestSchema(Schema):
+        class Meta:
+            ordered = True
+
+        d = fields.Str(required=True)
+        c = fields.Str()
+        a = fields.Str(required=True, data_key="z")
+
+    data = JSONSchema(props_ordered=True).dump(TestSchema())
+
+    definition = data["definitions"]["TestSchema"]
+    assert list(definition["properties"]) == ["d", "c", "z"]
+    assert definition["required"] == ["z", "d"]
+
+
+def test_dump_schema_class(json_schema):
+    instantiations = []
+
+    class TestSchema(Schema):
+        foo = fields.Integer(required=True)
+        nested = fields.Nested(UserSchema)
+
+        def __init__(self, *args, **kwargs):
+            instantiations.append(self)
+            super().__init__(*args, **kwargs)
+
+    assert json_schema.dump(TestSchema) == validate_and_dump(TestSchema(), json_schema)
+    assert len(instantiations) == 2
+
+
+def test_nested_refs_not_shared(json_schema):
+    class ChildSchema(Schema):
+        foo = fields.Integer()
+
+    class TestSchema(Schema):
+        first = fields.Nested(ChildSchema, metadata={"description": "first child"})
+        second = fields.Nested(ChildSchema)
+
+    dumped = validate_and_dump(TestSchema(), json_schema)
+
+    props = dumped["definitions"]["TestSchema"]["properties"]
+    assert props["first"] == {"type": "object", "$ref": "#/definitions/ChildSchema", "description": "first child"}
+    assert props["second"] == {"type": "object", "$ref": "#/definitions/ChildSchema"}
+
+
+def test_dump_does_not_leak_definitions(json_schema):
+    class FirstSchema(Schema):
+        github = fields.Nested("GithubProfile")
+
+    class SecondSchema(Schema):
+        foo = fields.Integer()
+
+    first = validate_and_dump(FirstSchema(), json_schema)
+    second = validate_and_dump(SecondSchema(), json_schema)
+
+    assert set(first["definitions"]) == {"FirstSchema", "GithubProfile"}
+    assert set(second["definitions"]) == {"SecondSchema"}
+
+
+def test_native_enum_support_matches_marshmallow():
+    assert TEST_MARSHMALLOW_NATIVE_ENUM is (MarshmallowNativeEnumField is not None)
+
+
+def test_validate_schema_does_not_mutate_dump(json_schema):
+    dumped = json_schema.dump(UserSchema())
+    expected = copy.deepcopy(dumped)
+
+    _validate_schema(dumped)
+
+    assert dumped == expected
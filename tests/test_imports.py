@@ -1,15 +1,18 @@
-import importlib
+import pytest
+from marshmallow_enum import EnumField, LoadDumpOptions
 
-import marshmallow_jsonschema
+from marshmallow_jsonschema.base import _detect_marshmallow_enum_support
 
 
-def test_import_marshmallow_enum(monkeypatch):
-    monkeypatch.delattr("marshmallow_enum.EnumField")
+@pytest.mark.parametrize(
+    ("installed", "expected"),
+    [
+        pytest.param(True, (EnumField, LoadDumpOptions), id="installed"),
+        pytest.param(False, (None, None), id="missing"),
+    ],
+)
+def test_import_marshmallow_enum(monkeypatch, installed, expected):
+    if not installed:
+        monkeypatch.delattr("marshmallow_enum.EnumField")
 
-    base = importlib.reload(marshmallow_jsonschema.base)
-
-    assert not base.ALLOW_MARSHMALLOW_ENUM_ENUMS
-
-    monkeypatch.undo()
-
-    importlib.reload(marshmallow_jsonschema.base)
+    assert _detect_marshmallow_enum_support() == expected
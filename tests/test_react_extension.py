@@ -35,3 +35,30 @@ def test_can_dump_react_jsonschema_form():
             }
         },
     }
+
+
+def test_uischema_per_instance_metadata():
+    class ReadonlySchema(ma.Schema):
+        name = ma.fields.String()
+
+        def __init__(self, *args, readonly=False, **kwargs):
+            super().__init__(*args, **kwargs)
+            if readonly:
+                field = self.fields["name"]
+                field.metadata = {**field.metadata, "ui:disabled": True}
+
+    json_schema_obj = ReactJsonSchemaFormJSONSchema()
+
+    assert json_schema_obj.dump_uischema(ReadonlySchema()) == {"name": {}}
+    assert json_schema_obj.dump_uischema(ReadonlySchema(readonly=True)) == {"name": {"ui:disabled": True}}
+
+
+def test_uischema_legacy_metadata_not_mutated():
+    class LegacySchema(ma.Schema):
+        name = ma.fields.String(metadata={"metadata": {"ui:widget": "textarea"}, "ui:autofocus": True})
+
+    schema = LegacySchema()
+    uischema = ReactJsonSchemaFormJSONSchema().dump_uischema(schema)
+
+    assert uischema["name"] == {"ui:widget": "textarea", "ui:autofocus": True}
+    assert schema.fields["name"].metadata["metadata"] == {"ui:widget": "textarea"}
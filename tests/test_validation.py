@@ -7,6 +7,7 @@ from marshmallow_enum import EnumField
 from marshmallow_union import Union
 
 from marshmallow_jsonschema import JSONSchema, UnsupportedValueError
+from marshmallow_jsonschema.base import FIELD_VALIDATORS
 
 from . import UserSchema, validate_and_dump
 
@@ -274,3 +275,34 @@ def test_union():
     foo_property = dumped["definitions"]["TestSchema"]["properties"]["foo"]
     assert {"title": "", "type": "string"} in foo_property["anyOf"]
     assert {"title": "", "type": "integer"} in foo_property["anyOf"]
+
+
+def test_unsupported_validator_ignored():
+    class TestSchema(Schema):
+        foo = fields.String(validate=[validate.NoneOf(["bar"]), validate.Length(max=3)])
+
+    schema = TestSchema()
+
+    dumped = validate_and_dump(schema)
+    dumped_again = validate_and_dump(schema)
+
+    foo_property = dumped["definitions"]["TestSchema"]["properties"]["foo"]
+    assert foo_property == {"title": "foo", "type": "string", "maxLength": 3}
+    assert dumped_again == dumped
+
+
+def test_validator_registered_after_dump(monkeypatch):
+    class TestSchema(Schema):
+        foo = fields.String(validate=validate.NoneOf(["bar"]))
+
+    schema = TestSchema()
+    validate_and_dump(schema)
+
+    def handle_none_of(schema, _field, validator, _parent_schema):
+        schema["not"] = {"enum": list(validator.iterable)}
+        return schema
+
+    monkeypatch.setitem(FIELD_VALIDATORS, validate.NoneOf, handle_none_of)
+    dumped = validate_and_dump(schema)
+
+    assert dumped["definitions"]["TestSchema"]["properties"]["foo"]["not"] == {"enum": ["bar"]}